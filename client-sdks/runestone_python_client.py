@@ -3,10 +3,450 @@ Runestone OpenAI-Compatible API Client for Python
 Compatible with OpenAI Python SDK
 """
 
-from typing import Optional, Dict, Any, List, Iterator
-import requests
+from typing import (
+    TYPE_CHECKING, Optional, Dict, Any, List, Iterable, Iterator, AsyncIterable,
+    AsyncIterator, Callable, Literal
+)
+from functools import cached_property
+import asyncio
+import hashlib
 import json
-import sseclient
+import threading
+import time
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib json module
+    orjson = None
+
+# requests and httpx are imported on first use so that importing this module
+# (or using only one of the two clients) does not pay for the other stack
+if TYPE_CHECKING:
+    import httpx
+    import requests
+
+__all__ = [
+    "RunestoneClient",
+    "AsyncRunestoneClient",
+    "RunestoneError",
+    "APIError",
+    "AuthenticationError",
+    "RateLimitError",
+    "ChatCompletionChunk",
+    "ChunkChoice",
+    "ChoiceDelta",
+]
+
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+    _json_loads = json.loads
+
+class RunestoneError(Exception):
+    """Base class for errors raised by the Runestone client"""
+
+class APIError(RunestoneError):
+    """The API returned an error status"""
+    
+    def __init__(self, message: str, status_code: Optional[int] = None, response: Any = None):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+        self.response = response
+
+class AuthenticationError(APIError):
+    """The API key is missing or invalid (HTTP 401)"""
+
+class RateLimitError(APIError):
+    """The rate limit was exceeded (HTTP 429)"""
+
+_ERROR_TEXT_LIMIT = 2048
+
+def _error_message(response: Any) -> str:
+    # Only JSON bodies are parsed; HTML error pages from proxies can be large
+    # and are reduced to a short prefix. Slicing the bytes before decoding
+    # also skips charset detection on the full body.
+    text = response.content[:_ERROR_TEXT_LIMIT].decode("utf-8", "replace")
+    if "json" not in response.headers.get("Content-Type", ""):
+        return text
+    try:
+        body = _json_loads(response.content)
+    except ValueError:  # orjson.JSONDecodeError and json.JSONDecodeError
+        return text
+    error = body.get("error") if isinstance(body, dict) else None
+    return _describe_error(error) or text
+
+def _describe_error(error: Any) -> Optional[str]:
+    """Message for an "error" value: either {"message": ...} or a bare string"""
+    if isinstance(error, dict):
+        return error.get("message") or None
+    return str(error) if error else None
+
+_STATUS_ERRORS = {401: AuthenticationError, 429: RateLimitError}
+
+def _api_error(response: Any) -> APIError:
+    """Build the typed exception for an error response (requests or httpx)"""
+    status = response.status_code
+    message = _error_message(response)
+    error_class = _STATUS_ERRORS.get(status)
+    if error_class is not None:
+        return error_class(message, status, response)
+    return APIError(f"HTTP {status}: {message}", status, response)
+
+class _SSEDecoder:
+    """
+    Incremental Server-Sent Events parser
+    
+    Bytes may be fed in arbitrary fragments. Only complete lines are
+    parsed and an event is emitted once its terminating blank line has
+    arrived, so payloads split across network reads (including in the
+    middle of a multibyte character) are reassembled before decoding.
+    """
+    
+    def __init__(self):
+        self._buffer = bytearray()
+        self._data: List[bytes] = []
+    
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """Consume a chunk and return the data payloads of completed events"""
+        self._buffer += chunk
+        end = self._buffer.rfind(b"\n")
+        if end < 0:
+            return []
+        
+        lines = self._buffer[:end].split(b"\n")
+        del self._buffer[:end + 1]
+        
+        events = []
+        for line in lines:
+            if line.endswith(b"\r"):
+                line = line[:-1]
+            if not line:
+                # Blank line: dispatch the event; multiple data lines join with \n
+                if self._data:
+                    events.append(b"\n".join(self._data))
+                    self._data = []
+            elif line.startswith(b"data:"):
+                value = line[5:]
+                if value.startswith(b" "):
+                    value = value[1:]
+                self._data.append(bytes(value))
+            # Comments (":...") and other fields (event, id, retry) are ignored
+        return events
+
+def _iter_sse(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Yield the data payload of each event in a byte stream until [DONE]"""
+    decoder = _SSEDecoder()
+    for chunk in chunks:
+        for data in decoder.feed(chunk):
+            if data == b"[DONE]":
+                return
+            yield data
+
+async def _aiter_sse(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """Async counterpart of _iter_sse"""
+    decoder = _SSEDecoder()
+    async for chunk in chunks:
+        for data in decoder.feed(chunk):
+            if data == b"[DONE]":
+                return
+            yield data
+
+def _stream_chunk(data: bytes, raw: bool) -> Any:
+    """
+    Decode one streamed payload into a chunk, or None if it should be skipped
+    
+    The server reports failures after the stream has started as events with
+    an "error" key; those are raised as APIError. In typed mode payloads
+    without "choices" are not completion chunks and are skipped.
+    """
+    chunk = _json_loads(data)
+    if not isinstance(chunk, dict):
+        return chunk if raw else None
+    if "error" in chunk:
+        raise APIError(f"Stream error: {_describe_error(chunk['error']) or 'unknown error'}")
+    if raw:
+        return chunk
+    if "choices" not in chunk:
+        return None
+    return ChatCompletionChunk.from_dict(chunk)
+
+class ChoiceDelta:
+    """Incremental message content carried by one streamed choice"""
+    
+    __slots__ = ("role", "content", "tool_calls")
+    
+    def __init__(self, role: Optional[str] = None, content: Optional[str] = None,
+                 tool_calls: Optional[List[Dict[str, Any]]] = None):
+        self.role = role
+        self.content = content
+        self.tool_calls = tool_calls
+    
+    def __repr__(self) -> str:
+        return f"ChoiceDelta(role={self.role!r}, content={self.content!r})"
+
+class ChunkChoice:
+    """One choice within a streamed chat completion chunk"""
+    
+    __slots__ = ("index", "delta", "finish_reason")
+    
+    def __init__(self, index: int, delta: ChoiceDelta, finish_reason: Optional[str] = None):
+        self.index = index
+        self.delta = delta
+        self.finish_reason = finish_reason
+    
+    def __repr__(self) -> str:
+        return f"ChunkChoice(index={self.index!r}, delta={self.delta!r}, finish_reason={self.finish_reason!r})"
+
+class ChatCompletionChunk:
+    """
+    A streamed chat completion chunk
+    
+    Fields are plain attributes on a fixed layout, so per-token access such
+    as ``chunk.choices[0].delta.content`` avoids repeated dict lookups.
+    """
+    
+    __slots__ = ("id", "object", "created", "model", "choices", "usage")
+    
+    def __init__(self, id: str, object: str, created: int, model: str,
+                 choices: List[ChunkChoice], usage: Optional[Dict[str, Any]] = None):
+        self.id = id
+        self.object = object
+        self.created = created
+        self.model = model
+        self.choices = choices
+        self.usage = usage
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ChatCompletionChunk":
+        choices = []
+        for choice in data.get("choices") or ():
+            delta = choice.get("delta") or {}
+            choices.append(ChunkChoice(
+                choice.get("index", 0),
+                ChoiceDelta(delta.get("role"), delta.get("content"), delta.get("tool_calls")),
+                choice.get("finish_reason")
+            ))
+        return cls(
+            data.get("id"),
+            data.get("object", "chat.completion.chunk"),
+            data.get("created"),
+            data.get("model"),
+            choices,
+            data.get("usage")
+        )
+    
+    def __repr__(self) -> str:
+        return f"ChatCompletionChunk(id={self.id!r}, model={self.model!r}, choices={self.choices!r})"
+
+_MISSING = object()
+
+class _TTLCache:
+    """
+    Small in-process cache with per-entry expiry and FIFO eviction
+    
+    Exposes the same get/set interface as ``diskcache.Cache`` so either can
+    be used for the embedding cache. Cached values are returned as-is, so
+    callers should treat them as read-only. Access is serialized by a lock
+    so one cache can be shared by the threads of ``create_batched``.
+    """
+    
+    def __init__(self, ttl: Optional[float] = None, max_entries: int = 128):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[Any, Any] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the cached value, or default if absent or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._entries[key]
+                return default
+            return value
+    
+    def set(self, key: Any, value: Any, expire: Optional[float] = None) -> None:
+        """Store value; expire overrides the default ttl (seconds, None = ttl)"""
+        ttl = self.ttl if expire is None else expire
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                # Dicts preserve insertion order, so the first key is the oldest
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (expires_at, value)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+def _embedding_inputs(kwargs: Dict[str, Any]) -> Optional[List[str]]:
+    """Normalize the embeddings input to a list of strings, or None if uncacheable"""
+    inputs = kwargs.get("input")
+    if isinstance(inputs, str):
+        return [inputs]
+    if isinstance(inputs, (list, tuple)) and inputs and all(isinstance(i, str) for i in inputs):
+        return list(inputs)
+    # Token arrays and anything unexpected go straight to the API
+    return None
+
+def _embedding_cache_keys(kwargs: Dict[str, Any], inputs: List[str]) -> Optional[List[tuple]]:
+    # Parameters such as dimensions or encoding_format change the vector,
+    # so they are part of the key alongside the model and the text hash.
+    # They are keyed by canonical JSON so nested values (lists, dicts) work.
+    params = {k: v for k, v in kwargs.items() if k not in ("model", "input", "user")}
+    try:
+        params_key = json.dumps(params, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None  # not representable as a key; send uncached
+    model = kwargs.get("model")
+    return [
+        (model, params_key, hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest())
+        for text in inputs
+    ]
+
+class _EmbeddingLookup:
+    """
+    Embedding cache lookup for one create() call
+    
+    ``payload`` is the request for the inputs missing from the cache, or
+    None if all of them were cached; ``complete()`` stores the vectors from
+    its response and builds the combined result in input order.
+    """
+    
+    __slots__ = ("cache", "keys", "vectors", "missing", "payload", "model")
+    
+    def __init__(self, cache: Any, kwargs: Dict[str, Any], inputs: List[str], keys: List[tuple]):
+        self.cache = cache
+        self.keys = keys
+        self.vectors = [cache.get(key) for key in keys]
+        self.missing = [i for i, vector in enumerate(self.vectors) if vector is None]
+        self.payload = dict(kwargs, input=[inputs[i] for i in self.missing]) if self.missing else None
+        self.model = kwargs.get("model")
+    
+    def complete(self, result: Optional[Dict[str, Any]], expire: Optional[float]) -> Dict[str, Any]:
+        model = self.model
+        usage = {"prompt_tokens": 0, "total_tokens": 0}
+        if result is not None:
+            for item in result["data"]:
+                i = self.missing[item["index"]]
+                self.vectors[i] = item["embedding"]
+                self.cache.set(self.keys[i], self.vectors[i], expire=expire)
+            model = result.get("model", model)
+            usage = result.get("usage", usage)
+        return _embedding_response(model, self.vectors, usage)
+
+def _embedding_lookup(cache: Any, kwargs: Dict[str, Any]) -> Optional[_EmbeddingLookup]:
+    """Look up the request's inputs in cache, or return None if it cannot be cached"""
+    inputs = _embedding_inputs(kwargs)
+    if inputs is None:
+        return None
+    keys = _embedding_cache_keys(kwargs, inputs)
+    if keys is None:
+        return None
+    return _EmbeddingLookup(cache, kwargs, inputs, keys)
+
+def _embedding_batches(inputs: List[str], batch_size: int) -> List[List[str]]:
+    """Split inputs into consecutive batches of at most batch_size"""
+    return [inputs[i:i + batch_size] for i in range(0, len(inputs), batch_size)]
+
+def _merge_embedding_batches(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Concatenate per-batch embedding responses (in batch order) into one response"""
+    vectors = []
+    usage: Dict[str, int] = {}
+    for result in results:
+        vectors.extend(item["embedding"] for item in sorted(result["data"], key=lambda d: d["index"]))
+        for name, count in result.get("usage", {}).items():
+            usage[name] = usage.get(name, 0) + count
+    model = results[0].get("model") if results else None
+    return _embedding_response(model, vectors, usage)
+
+def _embedding_response(model: str, vectors: List[Any], usage: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "object": "list",
+        "data": [
+            {"object": "embedding", "index": i, "embedding": vector}
+            for i, vector in enumerate(vectors)
+        ],
+        "model": model,
+        "usage": usage,
+    }
+
+# Pools shared by clients created with shared_session=True, keyed by
+# transport, base URL and pool settings. Entries live for the process.
+_SESSION_REGISTRY: Dict[tuple, Any] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+def _shared_pool(key: tuple, build: Callable[[], Any]) -> Any:
+    with _REGISTRY_LOCK:
+        pool = _SESSION_REGISTRY.get(key)
+        if pool is None:
+            from http.cookiejar import DefaultCookiePolicy
+            
+            pool = build()
+            # The cookie jar would be shared by every client (and API key) on
+            # the pool, so shared pools reject all cookies. requests exposes
+            # the CookieJar directly, httpx wraps it in Cookies.jar.
+            jar = getattr(pool.cookies, "jar", pool.cookies)
+            jar.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            _SESSION_REGISTRY[key] = pool
+        return pool
+
+def _build_session(headers: Dict[str, str], max_retries: int, pool_connections: int,
+                   pool_maxsize: int, pool_block: bool) -> "requests.Session":
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    session.headers.update(headers)
+    # Transient failures are retried inside urllib3 on the same pooled
+    # connection. Read errors are not retried since the request may already
+    # have been processed. Once retries are exhausted the last response is
+    # returned (raise_on_status=False) and translated into a typed error.
+    retry = Retry(
+        total=max_retries,
+        connect=max_retries,
+        read=0,
+        status=max_retries,
+        backoff_factor=0.25,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "POST"}),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        max_retries=retry
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def _build_httpx_client(headers: Dict[str, str], timeout: float, max_retries: int,
+                        pool_connections: int, pool_maxsize: int) -> "httpx.Client":
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError("transport='httpx' requires httpx: pip install httpx[http2]") from None
+    
+    transport = httpx.HTTPTransport(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=pool_maxsize,
+            max_keepalive_connections=pool_connections
+        ),
+        retries=max_retries
+    )
+    return httpx.Client(headers=headers, timeout=timeout, transport=transport)
 
 class RunestoneClient:
     """
@@ -14,55 +454,202 @@ class RunestoneClient:
     
     Usage:
         client = RunestoneClient(api_key="your-api-key")
-        response = client.chat.completions.create(
+        response = client.chat.create(
             model="gpt-4o-mini",
             messages=[{"role": "user", "content": "Hello!"}]
         )
+    
+    The client keeps a single ``requests.Session`` so connections to the
+    Runestone host are kept alive and reused across calls. Use it as a
+    context manager (or call ``close()``) to release the pooled sockets.
+    
+    A client is safe to share between threads; all threads draw from the
+    same connection pool. Raise ``pool_maxsize`` to at least the number of
+    concurrent callers, otherwise extra connections are opened and thrown
+    away (or, with ``pool_block=True``, callers wait for a free one).
+    
+    ``models.list()`` and ``models.retrieve()`` results are cached for
+    ``cache_ttl`` seconds; pass ``cache_enabled=False`` to always hit the API.
+    
+    Embeddings can be cached per (model, parameters, input text) by passing
+    ``embedding_cache``: either ``True`` for an in-memory cache or any object
+    with ``get(key)`` / ``set(key, value, expire=...)`` such as
+    ``diskcache.Cache``. Only inputs missing from the cache are sent to the
+    API; pass ``no_cache=True`` to ``embeddings.create`` to bypass it.
+    
+    ``transport="httpx"`` sends requests through an HTTP/2 ``httpx.Client``
+    instead (``pip install httpx[http2]``): concurrent calls from many threads
+    are multiplexed over one connection rather than one socket each. httpx
+    only retries failed connection attempts, not error statuses.
+    
+    With ``shared_session=True`` every client built with the same base URL,
+    transport and pool settings reuses one process-wide session, so clients
+    created per request or per task still get warm keep-alive connections.
+    The API key is then sent with each request instead of being stored on
+    the session, cookies from responses are discarded rather than shared
+    between clients, and ``close()`` leaves the shared pool open. Sessions are
+    safe for concurrent requests from many threads once ``pool_maxsize``
+    covers the number of callers.
     """
     
-    def __init__(self, api_key: str, base_url: str = "http://localhost:4001/v1"):
+    def __init__(self, api_key: str, base_url: str = "http://localhost:4001/v1",
+                 timeout: float = 60.0, max_retries: int = 2,
+                 pool_connections: int = 10, pool_maxsize: int = 100,
+                 pool_block: bool = False, cache_enabled: bool = True,
+                 cache_ttl: float = 300.0, embedding_cache: Any = None,
+                 embedding_cache_ttl: Optional[float] = None,
+                 transport: Literal["requests", "httpx"] = "requests",
+                 shared_session: bool = False):
+        if transport not in ("requests", "httpx"):
+            raise ValueError(f"Unknown transport {transport!r}; expected 'requests' or 'httpx'")
+        
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.cache_enabled = cache_enabled
+        self.cache_ttl = cache_ttl
+        self.embedding_cache = _TTLCache(max_entries=10000) if embedding_cache is True else embedding_cache
+        self.embedding_cache_ttl = embedding_cache_ttl
+        self._auth = f"Bearer {api_key}"
         self.headers = {
-            "Authorization": f"Bearer {api_key}",
+            "Authorization": self._auth,
             "Content-Type": "application/json"
         }
-        self.chat = ChatCompletions(self)
-        self.completions = Completions(self)
-        self.models = Models(self)
-        self.embeddings = Embeddings(self)
-    
-    def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
-        url = f"{self.base_url}{endpoint}"
-        kwargs.setdefault("headers", {}).update(self.headers)
-        response = requests.request(method, url, **kwargs)
-        response.raise_for_status()
-        return response
-    
-    def _stream_request(self, endpoint: str, json_data: Dict) -> Iterator[Dict]:
-        url = f"{self.base_url}{endpoint}"
-        response = requests.post(url, headers=self.headers, json=json_data, stream=True)
-        response.raise_for_status()
-        
-        client = sseclient.SSEClient(response)
-        for event in client.events():
-            if event.data == "[DONE]":
-                break
-            yield json.loads(event.data)
+        # Endpoint URLs are fixed per client, so build them once
+        self._urls = {
+            "chat": f"{self.base_url}/chat/completions",
+            "completions": f"{self.base_url}/completions",
+            "models": f"{self.base_url}/models",
+            "embeddings": f"{self.base_url}/embeddings",
+        }
+        
+        self.transport = transport
+        self.shared_session = shared_session
+        self.session = None
+        self._httpx = None
+        # A shared pool serves clients with different keys, so Authorization
+        # is sent per request rather than kept in the pool's default headers
+        pool_headers = self.headers
+        self._request_headers = None
+        if shared_session:
+            pool_headers = {"Content-Type": "application/json"}
+            self._request_headers = {"Authorization": self._auth}
+        
+        if transport == "httpx":
+            build = lambda: _build_httpx_client(
+                pool_headers, self.timeout, self.max_retries, pool_connections, pool_maxsize
+            )
+        else:
+            build = lambda: _build_session(
+                pool_headers, self.max_retries, pool_connections, pool_maxsize, pool_block
+            )
+        if shared_session:
+            key = (transport, self.base_url, self.timeout, self.max_retries,
+                   pool_connections, pool_maxsize, pool_block)
+            pool = _shared_pool(key, build)
+        else:
+            pool = build()
+        if transport == "httpx":
+            self._httpx = pool
+        else:
+            self.session = pool
+    
+    @cached_property
+    def chat(self) -> "ChatCompletions":
+        return ChatCompletions(self)
+    
+    @cached_property
+    def completions(self) -> "Completions":
+        return Completions(self)
+    
+    @cached_property
+    def models(self) -> "Models":
+        return Models(self)
+    
+    @cached_property
+    def embeddings(self) -> "Embeddings":
+        return Embeddings(self)
+    
+    def close(self) -> None:
+        """Close the underlying session and its pooled connections"""
+        if self.shared_session:
+            return
+        if self._httpx is not None:
+            self._httpx.close()
+        else:
+            self.session.close()
+    
+    def __enter__(self) -> "RunestoneClient":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def _request(self, method: str, url: str, json_data: Optional[Dict] = None) -> "requests.Response":
+        # Default headers live on the session; only a shared session needs
+        # the per-client Authorization header merged in.
+        # The serialized bytes are the only copy of the payload: urllib3 writes
+        # a bytes body with a single sendall. Keep it as bytes even for large
+        # payloads; a chunked generator body would be consumed by the first
+        # attempt and the adapter's Retry could not replay it.
+        body = None if json_data is None else _json_dumps(json_data)
+        if self._httpx is not None:
+            response = self._httpx.request(method, url, content=body, headers=self._request_headers)
+        else:
+            response = self.session.request(
+                method, url, data=body, headers=self._request_headers, timeout=self.timeout
+            )
+        if response.status_code < 400:
+            return response
+        raise _api_error(response)
+    
+    def _get_json(self, url: str) -> Dict[str, Any]:
+        return _json_loads(self._request("GET", url).content)
+    
+    def _post_json(self, url: str, json_data: Dict) -> Dict[str, Any]:
+        return _json_loads(self._request("POST", url, json_data).content)
+    
+    def _stream_request(self, url: str, json_data: Dict, raw: bool = False) -> Iterator[Any]:
+        body = _json_dumps(json_data)
+        if self._httpx is not None:
+            with self._httpx.stream("POST", url, content=body,
+                                    headers=self._request_headers) as response:
+                if response.status_code >= 400:
+                    response.read()
+                    raise _api_error(response)
+                yield from self._iter_chunks(response.iter_bytes(), raw)
+        else:
+            with self.session.post(url, data=body, headers=self._request_headers,
+                                   stream=True, timeout=self.timeout) as response:
+                if response.status_code >= 400:
+                    raise _api_error(response)
+                yield from self._iter_chunks(response.iter_content(chunk_size=8192), raw)
+    
+    @staticmethod
+    def _iter_chunks(byte_chunks: Iterable[bytes], raw: bool) -> Iterator[Any]:
+        for data in _iter_sse(byte_chunks):
+            chunk = _stream_chunk(data, raw)
+            if chunk is not None:
+                yield chunk
 
 class ChatCompletions:
     def __init__(self, client: RunestoneClient):
         self.client = client
     
-    def create(self, **kwargs) -> Dict[str, Any]:
-        """Create a chat completion"""
+    def create(self, raw: bool = False, **kwargs) -> Dict[str, Any]:
+        """
+        Create a chat completion
+        
+        With stream=True, returns an iterator of ChatCompletionChunk objects,
+        or of plain dicts when raw=True.
+        """
         stream = kwargs.get("stream", False)
         
         if stream:
-            return self.client._stream_request("/chat/completions", kwargs)
+            return self.client._stream_request(self.client._urls["chat"], kwargs, raw)
         else:
-            response = self.client._request("POST", "/chat/completions", json=kwargs)
-            return response.json()
+            return self.client._post_json(self.client._urls["chat"], kwargs)
 
 class Completions:
     def __init__(self, client: RunestoneClient):
@@ -70,31 +657,265 @@ class Completions:
     
     def create(self, **kwargs) -> Dict[str, Any]:
         """Create a text completion"""
-        response = self.client._request("POST", "/completions", json=kwargs)
-        return response.json()
+        return self.client._post_json(self.client._urls["completions"], kwargs)
 
 class Models:
     def __init__(self, client: RunestoneClient):
         self.client = client
+        self._cache = _TTLCache(client.cache_ttl)
     
     def list(self) -> Dict[str, Any]:
         """List available models"""
-        response = self.client._request("GET", "/models")
-        return response.json()
+        return self._get(("list",), self.client._urls["models"])
     
     def retrieve(self, model: str) -> Dict[str, Any]:
         """Get model details"""
-        response = self.client._request("GET", f"/models/{model}")
-        return response.json()
+        return self._get(("retrieve", model), f"{self.client._urls['models']}/{model}")
+    
+    def _get(self, key: tuple, url: str) -> Dict[str, Any]:
+        if self.client.cache_enabled:
+            cached = self._cache.get(key, _MISSING)
+            if cached is not _MISSING:
+                return cached
+        
+        # Errors raise before anything is stored, so they are never cached
+        result = self.client._get_json(url)
+        if self.client.cache_enabled:
+            self._cache.set(key, result)
+        return result
 
 class Embeddings:
     def __init__(self, client: RunestoneClient):
         self.client = client
+        self.cache = client.embedding_cache
     
-    def create(self, **kwargs) -> Dict[str, Any]:
-        """Create embeddings"""
-        response = self.client._request("POST", "/embeddings", json=kwargs)
-        return response.json()
+    def create(self, no_cache: bool = False, **kwargs) -> Dict[str, Any]:
+        """Create embeddings, serving repeated inputs from the embedding cache if configured"""
+        lookup = None if self.cache is None or no_cache else _embedding_lookup(self.cache, kwargs)
+        if lookup is None:
+            return self.client._post_json(self.client._urls["embeddings"], kwargs)
+        
+        result = None
+        if lookup.payload is not None:
+            result = self.client._post_json(self.client._urls["embeddings"], lookup.payload)
+        return lookup.complete(result, self.client.embedding_cache_ttl)
+    
+    def create_batched(self, model: str, inputs: List[str], batch_size: int = 96,
+                       parallel: int = 4, **kwargs) -> Dict[str, Any]:
+        """
+        Embed a large list of inputs in batches of at most batch_size
+        
+        Batches are sent over the shared connection pool, up to `parallel`
+        at a time, and the results are returned as a single response with
+        indices matching `inputs`. Each batch goes through create(), so an
+        embedding cache still applies: cached inputs are dropped from their
+        batch before it is sent. With a cache, keep batch_size large enough
+        that partially cached batches still amortize the request overhead.
+        """
+        batches = _embedding_batches(inputs, batch_size)
+        
+        def embed(batch: List[str]) -> Dict[str, Any]:
+            return self.create(model=model, input=batch, **kwargs)
+        
+        if parallel > 1 and len(batches) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            
+            with ThreadPoolExecutor(max_workers=min(parallel, len(batches))) as executor:
+                results = list(executor.map(embed, batches))
+        else:
+            results = [embed(batch) for batch in batches]
+        return _merge_embedding_batches(results)
+
+class AsyncRunestoneClient:
+    """
+    Asynchronous Runestone API Client - OpenAI Compatible
+    
+    Requires ``httpx`` (``pip install httpx[http2]``). Requests share one
+    ``httpx.AsyncClient`` so many calls can run concurrently over a few
+    kept-alive (and, with HTTP/2, multiplexed) connections.
+    
+    Usage:
+        async with AsyncRunestoneClient(api_key="your-api-key") as client:
+            results = await asyncio.gather(*[
+                client.embeddings.create(model="text-embedding-ada-002", input=text)
+                for text in texts
+            ])
+    """
+    
+    def __init__(self, api_key: str, base_url: str = "http://localhost:4001/v1",
+                 timeout: float = 60.0, max_retries: int = 2,
+                 pool_connections: int = 10, pool_maxsize: int = 100,
+                 http2: bool = True, cache_enabled: bool = True,
+                 cache_ttl: float = 300.0, embedding_cache: Any = None,
+                 embedding_cache_ttl: Optional[float] = None):
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError("AsyncRunestoneClient requires httpx: pip install httpx[http2]") from None
+        
+        self.api_key = api_key
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.cache_enabled = cache_enabled
+        self.cache_ttl = cache_ttl
+        self.embedding_cache = _TTLCache(max_entries=10000) if embedding_cache is True else embedding_cache
+        self.embedding_cache_ttl = embedding_cache_ttl
+        self._auth = f"Bearer {api_key}"
+        self.headers = {
+            "Authorization": self._auth,
+            "Content-Type": "application/json"
+        }
+        # Endpoint URLs are fixed per client, so build them once
+        self._urls = {
+            "chat": f"{self.base_url}/chat/completions",
+            "completions": f"{self.base_url}/completions",
+            "models": f"{self.base_url}/models",
+            "embeddings": f"{self.base_url}/embeddings",
+        }
+        
+        # httpx only retries failed connection attempts, not error statuses
+        transport = httpx.AsyncHTTPTransport(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=pool_maxsize,
+                max_keepalive_connections=pool_connections
+            ),
+            retries=self.max_retries
+        )
+        self._client = httpx.AsyncClient(
+            headers=self.headers,
+            timeout=self.timeout,
+            transport=transport
+        )
+    
+    @cached_property
+    def chat(self) -> "AsyncChatCompletions":
+        return AsyncChatCompletions(self)
+    
+    @cached_property
+    def completions(self) -> "AsyncCompletions":
+        return AsyncCompletions(self)
+    
+    @cached_property
+    def models(self) -> "AsyncModels":
+        return AsyncModels(self)
+    
+    @cached_property
+    def embeddings(self) -> "AsyncEmbeddings":
+        return AsyncEmbeddings(self)
+    
+    async def close(self) -> None:
+        """Close the underlying httpx client and its pooled connections"""
+        await self._client.aclose()
+    
+    async def __aenter__(self) -> "AsyncRunestoneClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    async def _request(self, method: str, url: str, json_data: Optional[Dict] = None) -> "httpx.Response":
+        body = None if json_data is None else _json_dumps(json_data)
+        response = await self._client.request(method, url, content=body)
+        if response.status_code < 400:
+            return response
+        raise _api_error(response)
+    
+    async def _get_json(self, url: str) -> Dict[str, Any]:
+        return _json_loads((await self._request("GET", url)).content)
+    
+    async def _post_json(self, url: str, json_data: Dict) -> Dict[str, Any]:
+        return _json_loads((await self._request("POST", url, json_data)).content)
+    
+    async def _stream_request(self, url: str, json_data: Dict, raw: bool = False) -> AsyncIterator[Any]:
+        async with self._client.stream("POST", url, content=_json_dumps(json_data)) as response:
+            if response.status_code >= 400:
+                await response.aread()
+                raise _api_error(response)
+            async for data in _aiter_sse(response.aiter_bytes()):
+                chunk = _stream_chunk(data, raw)
+                if chunk is not None:
+                    yield chunk
+
+class AsyncChatCompletions:
+    def __init__(self, client: AsyncRunestoneClient):
+        self.client = client
+    
+    async def create(self, raw: bool = False, **kwargs) -> Dict[str, Any]:
+        """
+        Create a chat completion
+        
+        With stream=True, returns an async iterator of ChatCompletionChunk
+        objects, or of plain dicts when raw=True.
+        """
+        stream = kwargs.get("stream", False)
+        
+        if stream:
+            return self.client._stream_request(self.client._urls["chat"], kwargs, raw)
+        else:
+            return await self.client._post_json(self.client._urls["chat"], kwargs)
+
+class AsyncCompletions:
+    def __init__(self, client: AsyncRunestoneClient):
+        self.client = client
+    
+    async def create(self, **kwargs) -> Dict[str, Any]:
+        """Create a text completion"""
+        return await self.client._post_json(self.client._urls["completions"], kwargs)
+
+class AsyncModels:
+    def __init__(self, client: AsyncRunestoneClient):
+        self.client = client
+        self._cache = _TTLCache(client.cache_ttl)
+    
+    async def list(self) -> Dict[str, Any]:
+        """List available models"""
+        return await self._get(("list",), self.client._urls["models"])
+    
+    async def retrieve(self, model: str) -> Dict[str, Any]:
+        """Get model details"""
+        return await self._get(("retrieve", model), f"{self.client._urls['models']}/{model}")
+    
+    async def _get(self, key: tuple, url: str) -> Dict[str, Any]:
+        if self.client.cache_enabled:
+            cached = self._cache.get(key, _MISSING)
+            if cached is not _MISSING:
+                return cached
+        
+        result = await self.client._get_json(url)
+        if self.client.cache_enabled:
+            self._cache.set(key, result)
+        return result
+
+class AsyncEmbeddings:
+    def __init__(self, client: AsyncRunestoneClient):
+        self.client = client
+        self.cache = client.embedding_cache
+    
+    async def create(self, no_cache: bool = False, **kwargs) -> Dict[str, Any]:
+        """Create embeddings, serving repeated inputs from the embedding cache if configured"""
+        lookup = None if self.cache is None or no_cache else _embedding_lookup(self.cache, kwargs)
+        if lookup is None:
+            return await self.client._post_json(self.client._urls["embeddings"], kwargs)
+        
+        result = None
+        if lookup.payload is not None:
+            result = await self.client._post_json(self.client._urls["embeddings"], lookup.payload)
+        return lookup.complete(result, self.client.embedding_cache_ttl)
+    
+    async def create_batched(self, model: str, inputs: List[str], batch_size: int = 96,
+                             parallel: int = 4, **kwargs) -> Dict[str, Any]:
+        """Async counterpart of Embeddings.create_batched; `parallel` caps in-flight batches"""
+        batches = _embedding_batches(inputs, batch_size)
+        semaphore = asyncio.Semaphore(max(parallel, 1))
+        
+        async def embed(batch: List[str]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.create(model=model, input=batch, **kwargs)
+        
+        results = await asyncio.gather(*(embed(batch) for batch in batches))
+        return _merge_embedding_batches(list(results))
 
 # Example usage
 if __name__ == "__main__":
@@ -102,7 +923,7 @@ if __name__ == "__main__":
     client = RunestoneClient(api_key="sk-test-key")
     
     # Chat completion
-    response = client.chat.completions.create(
+    response = client.chat.create(
         model="gpt-4o-mini",
         messages=[{"role": "user", "content": "Hello, how are you?"}],
         temperature=0.7
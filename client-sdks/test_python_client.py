@@ -0,0 +1,138 @@
+"""
+Offline tests for the Runestone Python client's stream parsing and caches
+
+Run with: python -m unittest test_python_client
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from runestone_python_client import (  # noqa: E402
+    APIError, ChatCompletionChunk, Embeddings, RunestoneClient, _SSEDecoder, _TTLCache, _iter_sse
+)
+
+
+def _event(payload: str) -> bytes:
+    return f"data: {payload}\n\n".encode("utf-8")
+
+
+def _split(blob: bytes, size: int):
+    return [blob[i:i + size] for i in range(0, len(blob), size)]
+
+
+CHUNK = '{"id":"c1","object":"chat.completion.chunk","created":1,"model":"m",' \
+        '"choices":[{"index":0,"delta":{"content":"%s"},"finish_reason":null}]}'
+
+
+class SSEDecoderTest(unittest.TestCase):
+    def test_reassembles_events_split_across_reads(self):
+        blob = _event("héllo") + _event("wörld ✓")
+        decoder = _SSEDecoder()
+        events = []
+        # 3-byte reads split both the lines and the multibyte characters
+        for part in _split(blob, 3):
+            events.extend(decoder.feed(part))
+        self.assertEqual([e.decode("utf-8") for e in events], ["héllo", "wörld ✓"])
+
+    def test_joins_data_lines_and_ignores_comments(self):
+        decoder = _SSEDecoder()
+        events = decoder.feed(b": keepalive\r\n\r\nevent: message\r\ndata: a\r\ndata: b\r\n\r\n")
+        self.assertEqual(events, [b"a\nb"])
+
+    def test_incomplete_event_is_held_back(self):
+        decoder = _SSEDecoder()
+        self.assertEqual(decoder.feed(b"data: partial"), [])
+        self.assertEqual(decoder.feed(b"\n"), [])
+        self.assertEqual(decoder.feed(b"\n"), [b"partial"])
+
+    def test_iter_sse_stops_at_done(self):
+        blob = _event("one") + _event("[DONE]") + _event("after")
+        self.assertEqual(list(_iter_sse(_split(blob, 5))), [b"one"])
+
+
+class StreamChunkTest(unittest.TestCase):
+    def _chunks(self, blob: bytes, raw: bool = False):
+        return RunestoneClient._iter_chunks(_split(blob, 7), raw)
+
+    def test_yields_typed_chunks(self):
+        blob = _event(CHUNK % "Hé") + _event(CHUNK % "llo") + _event("[DONE]")
+        chunks = list(self._chunks(blob))
+        self.assertTrue(all(isinstance(c, ChatCompletionChunk) for c in chunks))
+        self.assertEqual("".join(c.choices[0].delta.content for c in chunks), "Héllo")
+
+    def test_error_event_raises(self):
+        for error in ('{"error":"timeout"}',
+                      '{"error":{"message":"provider failed","type":"stream_error"}}'):
+            for raw in (False, True):
+                with self.subTest(error=error, raw=raw):
+                    stream = self._chunks(_event(CHUNK % "a") + _event(error) + _event("[DONE]"), raw)
+                    next(stream)
+                    with self.assertRaises(APIError) as ctx:
+                        next(stream)
+                    self.assertIn("timeout" if "timeout" in error else "provider failed",
+                                  str(ctx.exception))
+
+    def test_payloads_without_choices_are_skipped_in_typed_mode(self):
+        blob = _event('{"status":"connected"}') + _event(CHUNK % "x") + _event("[DONE]")
+        self.assertEqual(len(list(self._chunks(blob))), 1)
+        self.assertEqual(list(self._chunks(blob, raw=True))[0], {"status": "connected"})
+
+
+class _FakeEmbeddingsClient:
+    """Just enough of RunestoneClient for Embeddings; records request payloads"""
+
+    embedding_cache_ttl = None
+    _urls = {"embeddings": "http://test/v1/embeddings"}
+
+    def __init__(self):
+        self.embedding_cache = _TTLCache(max_entries=100)
+        self.requests = []
+
+    def _post_json(self, url, payload):
+        self.requests.append(payload)
+        inputs = [payload["input"]] if isinstance(payload["input"], str) else payload["input"]
+        return {
+            "object": "list",
+            "model": payload["model"],
+            "data": [{"object": "embedding", "index": i, "embedding": [float(len(text))]}
+                     for i, text in enumerate(inputs)],
+            "usage": {"prompt_tokens": len(inputs), "total_tokens": len(inputs)},
+        }
+
+
+class EmbeddingCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.client = _FakeEmbeddingsClient()
+        self.embeddings = Embeddings(self.client)
+
+    def test_only_missing_inputs_are_requested(self):
+        self.embeddings.create(model="e", input=["a", "bb"])
+        result = self.embeddings.create(model="e", input=["bb", "ccc", "a"])
+        self.assertEqual(self.client.requests[-1]["input"], ["ccc"])
+        self.assertEqual([d["embedding"] for d in result["data"]], [[2.0], [3.0], [1.0]])
+        self.assertEqual([d["index"] for d in result["data"]], [0, 1, 2])
+
+    def test_nested_params_are_part_of_the_key(self):
+        self.embeddings.create(model="e", input="a", extra={"a": [1]})
+        self.embeddings.create(model="e", input="a", extra={"a": [1]})
+        self.embeddings.create(model="e", input="a", extra={"a": [2]})
+        self.assertEqual(len(self.client.requests), 2)
+
+    def test_create_batched_keeps_input_order(self):
+        texts = ["x" * n for n in range(1, 8)]
+        result = self.embeddings.create_batched(model="e", inputs=texts, batch_size=3, parallel=3)
+        self.assertEqual(sorted(len(batch["input"]) for batch in self.client.requests), [1, 3, 3])
+        self.assertEqual([d["embedding"] for d in result["data"]], [[float(n)] for n in range(1, 8)])
+        self.assertEqual(result["usage"]["total_tokens"], 7)
+
+    def test_params_without_a_json_form_bypass_the_cache(self):
+        for _ in range(2):
+            self.embeddings.create(model="e", input="a", extra=object())
+        self.assertEqual(len(self.client.requests), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
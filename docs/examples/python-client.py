@@ -7,6 +7,7 @@ It provides examples for all major endpoints and features.
 
 Requirements:
     pip install requests
+    pip install orjson  # optional, faster JSON decoding of streamed chunks
 
 Usage:
     python python-client.py
@@ -18,6 +19,53 @@ import requests
 import time
 from typing import Dict, Iterator, Optional, List
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+def _iter_sse(response: requests.Response) -> Iterator[bytes]:
+    """
+    Yield the data payload of each Server-Sent Event in a streaming response
+    
+    Chunks are buffered until a complete event (terminated by a blank line)
+    has arrived, so JSON payloads split across network reads are never
+    parsed half-way. Multiple data lines in one event are joined with a
+    newline, comment lines are skipped, and iteration stops at [DONE].
+    
+    Args:
+        response: Streaming response (requested with stream=True)
+        
+    Yields:
+        Raw event payloads
+    """
+    buffer = bytearray()
+    data_lines = []
+    
+    for chunk in response.iter_content(chunk_size=8192):
+        buffer += chunk
+        end = buffer.rfind(b'\n')
+        if end < 0:
+            continue
+        
+        lines = buffer[:end].split(b'\n')
+        del buffer[:end + 1]
+        
+        for line in lines:
+            if line.endswith(b'\r'):
+                line = line[:-1]
+            if not line:
+                if data_lines:
+                    data = b'\n'.join(data_lines)
+                    data_lines = []
+                    if data == b'[DONE]':
+                        return
+                    yield data
+            elif line.startswith(b'data:'):
+                value = line[5:]
+                data_lines.append(bytes(value[1:] if value.startswith(b' ') else value))
+
 
 class RunestoneClient:
     """
@@ -120,14 +168,8 @@ class RunestoneClient:
             with self.session.post(url, json=payload, stream=True) as response:
                 response.raise_for_status()
                 
-                for line in response.iter_lines():
-                    if line:
-                        line_str = line.decode('utf-8')
-                        if line_str.startswith('data: '):
-                            data = line_str[6:].strip()
-                            if data == '[DONE]':
-                                break
-                            yield data
+                for data in _iter_sse(response):
+                    yield data.decode('utf-8')
                             
         except requests.exceptions.RequestException as e:
             yield f"error: {str(e)}"
@@ -273,17 +315,12 @@ class RunestoneClient:
             with self.session.post(url, json=payload, stream=True) as response:
                 response.raise_for_status()
                 
-                for line in response.iter_lines():
-                    if line:
-                        line_str = line.decode('utf-8')
-                        if line_str.startswith('data: '):
-                            data = line_str[6:].strip()
-                            if data == '[DONE]':
-                                break
-                            try:
-                                yield json.loads(data)
-                            except json.JSONDecodeError:
-                                continue
+                for data in _iter_sse(response):
+                    # Payloads stay bytes; both orjson and json accept them
+                    try:
+                        yield _json_loads(data)
+                    except ValueError:
+                        continue
                                 
         except requests.exceptions.RequestException as e:
             yield {"error": f"Streaming failed: {str(e)}"}
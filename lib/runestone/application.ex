@@ -48,6 +48,9 @@ defmodule Runestone.Application do
        plug: Runestone.HTTP.Router,
        options: [
          port: Application.get_env(:runestone, :port, 4003),
+         # gzip responses for clients that send Accept-Encoding; streamed
+         # chunks are flushed as they are written, so SSE stays incremental
+         compress: true,
          protocol_options: [idle_timeout: 120_000]
        ]},
        
@@ -9,6 +9,8 @@ defmodule Runestone.HTTP.Router do
   alias Runestone.Response.UnifiedStreamRelay
   
   plug Plug.Logger
+  # Answer HEAD probes with the matching GET route, minus the body
+  plug Plug.Head
   plug :match
   plug Plug.Parsers,
     parsers: [:json],
@@ -89,8 +89,8 @@ run_python_tests() {
     print_section "🐍 Running Python SDK Compatibility Tests..."
     
     if command_exists python3; then
-        # Check if OpenAI SDK is installed
-        if python3 -c "import openai" >/dev/null 2>&1; then
+        # Check for Python 3.10+ with the OpenAI SDK and httpx HTTP/2 support
+        if python3 -c "import sys, openai, httpx, h2; sys.exit(sys.version_info < (3, 10))" >/dev/null 2>&1; then
             print_status $BLUE "Running Python SDK validation..."
             cd "$VALIDATION_DIR"
             if python3 python_sdk_test.py --base-url "$RUNESTONE_URL" --api-key "$API_KEY"; then
@@ -101,8 +101,8 @@ run_python_tests() {
                 return 1
             fi
         else
-            print_status $YELLOW "⚠️  OpenAI Python SDK not installed"
-            print_status $YELLOW "   Install with: pip install openai requests"
+            print_status $YELLOW "⚠️  Python 3.10+ with the OpenAI SDK and httpx HTTP/2 support not found"
+            print_status $YELLOW "   Install with: pip install openai 'httpx[http2]'"
             return 0
         fi
     else